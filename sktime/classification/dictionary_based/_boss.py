@@ -9,11 +9,10 @@ __author__ = ["MatthewMiddlehurst"]
 __all__ = ["BOSSEnsemble", "IndividualBOSS", "boss_distance"]
 
 import sys
-from itertools import compress
 
 import numpy as np
 from joblib import Parallel, delayed
-from numba import njit, types
+from numba import config, get_num_threads, njit, prange, set_num_threads, types
 from numba.typed.typeddict import Dict
 from sklearn.utils import check_random_state
 
@@ -59,10 +58,9 @@ class BOSSEnsemble(BaseClassifier):
     min_window : int, default=10
         Minimum window size.
     typed_dict : bool, default=True
-        Use a numba TypedDict to store word counts. May increase memory usage, but will
-        be faster for larger datasets. As the Dict cannot be pickled currently, there
-        will be some overhead converting it to a python dict with multiple threads and
-        pickling.
+        Passed to the SFA transform. If True, words must fit in 64 bits, which limits
+        word length times bits per letter. If False, larger words are also supported,
+        but are slower to transform. Word counts are always stored in numpy arrays.
     save_train_predictions : bool, default=False
         Save the ensemble member train predictions in fit for use in _get_train_probs
         leave-one-out cross-validation.
@@ -184,7 +182,9 @@ class BOSSEnsemble(BaseClassifier):
         # Window length parameter space dependent on series length
         max_window_searches = self.series_length_ / 4
 
-        max_window = int(self.series_length_ * self.max_win_len_prop)
+        max_window = min(
+            int(self.series_length_ * self.max_win_len_prop), self.series_length_
+        )
         win_inc = int((max_window - self.min_window) / max_window_searches)
         if win_inc < 1:
             win_inc = 1
@@ -244,15 +244,11 @@ class BOSSEnsemble(BaseClassifier):
 
                     if best_acc_for_win_size > max_acc:
                         max_acc = best_acc_for_win_size
-                        self.estimators_ = list(
-                            compress(
-                                self.estimators_,
-                                [
-                                    classifier._accuracy >= max_acc * self.threshold
-                                    for c, classifier in enumerate(self.estimators_)
-                                ],
-                            )
-                        )
+                        self.estimators_ = [
+                            classifier
+                            for classifier in self.estimators_
+                            if classifier._accuracy >= max_acc * self.threshold
+                        ]
 
                     min_max_acc, min_acc_ind = self._worst_ensemble_acc()
 
@@ -299,13 +295,22 @@ class BOSSEnsemble(BaseClassifier):
         y : array-like, shape = [n_instances, n_classes_]
             Predicted probabilities using the ordering in classes_.
         """
-        sums = np.zeros((X.shape[0], self.n_classes_))
+        # the nearest neighbour search releases the GIL, so threads are sufficient
+        if self._threads_to_use > 1:
+            all_preds = Parallel(n_jobs=self._threads_to_use, prefer="threads")(
+                delayed(clf.predict)(X) for clf in self.estimators_
+            )
+        else:
+            all_preds = [clf.predict(X) for clf in self.estimators_]
 
-        for clf in self.estimators_:
-            preds = clf.predict(X)
-            for i in range(0, X.shape[0]):
-                sums[i, self._class_dictionary[preds[i]]] += 1
-        dists = sums / (np.ones(self.n_classes_) * self.n_estimators_)
+        # classes_ is sorted, so the column of each vote is found by binary search
+        # and the votes of all estimators are counted in one pass
+        votes = np.searchsorted(self.classes_, np.asarray(all_preds))
+        votes += np.arange(X.shape[0]) * self.n_classes_
+        sums = np.bincount(
+            votes.ravel(), minlength=X.shape[0] * self.n_classes_
+        ).reshape(X.shape[0], self.n_classes_)
+        dists = sums / self.n_estimators_
 
         return dists
 
@@ -344,42 +349,36 @@ class BOSSEnsemble(BaseClassifier):
         results = np.zeros((n_instances, self.n_classes_))
         divisors = np.zeros(n_instances)
 
-        for i, clf in enumerate(self.estimators_):
+        for clf in self.estimators_:
             preds = (
                 clf._train_predictions
                 if self.save_train_predictions
-                else Parallel(n_jobs=self._threads_to_use)(
-                    delayed(clf._train_predict)(
-                        i,
-                    )
-                    for i in range(n_instances)
-                )
+                else clf._train_predict_all()
             )
 
-            for n, pred in enumerate(preds):
-                results[n][self._class_dictionary[pred]] += 1
-                divisors[n] += 1
+            # each estimator votes once for each instance it predicted, so the
+            # votes are added for all instances at once
+            preds = np.asarray(preds)
+            voted = np.arange(len(preds))
+            if preds.dtype == object:
+                # instances without a nearest neighbour have no prediction
+                voted = voted[preds != None]  # noqa: E711
+            results[voted, np.searchsorted(self.classes_, preds[voted])] += 1
+            divisors[voted] += 1
 
-        for i in range(n_instances):
-            results[i] = (
-                np.ones(self.n_classes_) * (1 / self.n_classes_)
-                if divisors[i] == 0
-                else results[i] / (np.ones(self.n_classes_) * divisors[i])
-            )
+        # instances without any votes are given equal class probabilities
+        unvoted = divisors == 0
+        results[unvoted] = 1 / self.n_classes_
+        divisors[unvoted] = 1
 
-        return results
+        return results / divisors[:, None]
 
     def _individual_train_acc(self, boss, y, train_size, lowest_acc):
         correct = 0
         required_correct = int(lowest_acc * train_size)
 
         if self._threads_to_use > 1:
-            c = Parallel(n_jobs=self._threads_to_use)(
-                delayed(boss._train_predict)(
-                    i,
-                )
-                for i in range(train_size)
-            )
+            c = boss._train_predict_all()
 
             for i in range(train_size):
                 if correct + train_size - i < required_correct:
@@ -439,8 +438,9 @@ class IndividualBOSS(BaseClassifier):
         can shorten the time to calculate dictionaries using a shorter
         `word_length` (since the last "n" letters can be removed).
     typed_dict : bool, default=True
-        Use a numba TypedDict to store word counts. May increase memory usage, but will
-        be faster for larger datasets.
+        Passed to the SFA transform. If True, words must fit in 64 bits, which limits
+        word length times bits per letter. If False, larger words are also supported,
+        but are slower to transform. Word counts are always stored in numpy arrays.
     n_jobs : int, default=1
         The number of jobs to run in parallel for both `fit` and `predict`.
         ``-1`` means using all processors.
@@ -508,7 +508,12 @@ class IndividualBOSS(BaseClassifier):
         self.random_state = random_state
 
         self._transformer = None
-        self._transformed_data = []
+        self._bag_keys = np.zeros(0, dtype=np.int64)
+        self._bag_counts = np.zeros(0, dtype=np.uint32)
+        self._bag_indptr = np.zeros(1, dtype=np.int64)
+        self._bag_matrix = np.zeros((0, 0), dtype=np.uint32)
+        self._bag_vocabulary = np.zeros(0, dtype=np.int64)
+        self._large_word_vocabulary = None
         self._class_vals = []
         self._accuracy = 0
         self._subsample = []
@@ -516,31 +521,6 @@ class IndividualBOSS(BaseClassifier):
 
         super(IndividualBOSS, self).__init__()
 
-    def __getstate__(self):
-        """Return state as dictionary for pickling, required for typed Dict objects."""
-        state = self.__dict__.copy()
-        if self.typed_dict:
-            nl = [None] * len(self._transformed_data)
-            for i, ndict in enumerate(state["_transformed_data"]):
-                pdict = dict()
-                for key, val in ndict.items():
-                    pdict[key] = val
-                nl[i] = pdict
-            state["_transformed_data"] = nl
-        return state
-
-    def __setstate__(self, state):
-        """Set current state using input pickling, required for typed Dict objects."""
-        self.__dict__.update(state)
-        if self.typed_dict:
-            nl = [None] * len(self._transformed_data)
-            for i, pdict in enumerate(self._transformed_data):
-                ndict = Dict.empty(key_type=types.int64, value_type=types.uint32)
-                for key, val in pdict.items():
-                    ndict[key] = val
-                nl[i] = ndict
-            self._transformed_data = nl
-
     def _fit(self, X, y):
         """Fit a single boss classifier on n_instances cases (X,y).
 
@@ -573,8 +553,12 @@ class IndividualBOSS(BaseClassifier):
             n_jobs=self._threads_to_use,
         )
 
-        sfa = self._transformer.fit_transform(X)
-        self._transformed_data = sfa[0]
+        # the bags are counted straight from the array of words, rather than
+        # from word count dictionaries
+        words = self._transformer.fit(X)._transform_words(X)
+        if self.save_words:
+            self._transformer.words = list(words)
+        self._set_bags(*_words_to_arrays(self._word_ids(words, fit=True)))
         self._class_vals = y
 
         return self
@@ -592,49 +576,117 @@ class IndividualBOSS(BaseClassifier):
         y : array-like, shape = [n_instances]
             Predicted class labels.
         """
-        test_bags = self._transformer.transform(X)
-        test_bags = test_bags[0]
-
-        classes = Parallel(n_jobs=self._threads_to_use)(
-            delayed(self._test_nn)(
-                test_bag,
-            )
-            for test_bag in test_bags
+        test_words, test_counts, test_indptr = _words_to_arrays(
+            self._word_ids(self._transformer._transform_words(X))
         )
+        test_keys = self._words_to_keys(test_words)
 
-        return np.array(classes)
-
-    def _test_nn(self, test_bag):
+        # ties are broken randomly, with one draw for each tie found in the search
         rng = check_random_state(self.random_state)
 
-        best_dist = sys.float_info.max
-        nn = None
-
-        for n, bag in enumerate(self._transformed_data):
-            dist = boss_distance(test_bag, bag, best_dist)
+        if self._bag_matrix.shape[0] > 0:
+            nn = self._dense_nn_predict(test_keys, test_counts, test_indptr, rng)
+        else:
+            # the test cases are searched in chunks, to bound the tie draws held
+            n_test = len(test_indptr) - 1
+            nn = np.zeros(n_test, dtype=np.int64)
+            chunk_size = max(1, 2**20 // (len(self._bag_indptr) - 1))
+            for start in range(0, n_test, chunk_size):
+                end = min(start + chunk_size, n_test)
+                nn[start:end] = _nn_predict(
+                    test_keys,
+                    test_counts,
+                    test_indptr[start : end + 1],
+                    self._bag_keys,
+                    self._bag_counts,
+                    self._bag_indptr,
+                    self._bag_matrix,
+                    self._tie_draws(rng, end - start),
+                )
 
-            if dist < best_dist or (dist == best_dist and rng.random() < 0.5):
-                best_dist = dist
-                nn = self._class_vals[n]
+        return np.asarray(self._class_vals)[nn]
+
+    def _tie_draws(self, rng, n_test):
+        n_train = len(self._bag_indptr) - 1
+
+        # an int seed restarts the generator for every test case, so all cases
+        # share a single row of draws
+        if isinstance(self.random_state, (int, np.integer)):
+            return check_random_state(self.random_state).random_sample((1, n_train))
+
+        # otherwise the generator moves on from case to case, and each test case
+        # gets draws of its own
+        return rng.random_sample((n_test, n_train))
+
+    def _dense_nn_predict(self, test_keys, test_counts, test_indptr, rng):
+        # the boss distance only sums over words in the test bag, so
+        # dist(a, b) = |a|^2 + sum(b^2 where a > 0) - 2 a.b, which is found for all
+        # pairs with matrix products. counts are integers, so this is exact.
+        bags = self._bag_matrix.astype(np.float64)
+        bags_t = bags.T
+        bags_sq_t = (bags * bags).T
+
+        n_test = len(test_indptr) - 1
+        n_words = bags.shape[1]
+        rows = np.repeat(np.arange(n_test), np.diff(test_indptr))
+        counts = test_counts.astype(np.float64)
+        known = test_keys >= 0
+        test_norms = np.bincount(rows, weights=counts * counts, minlength=n_test)
+
+        # a chunk holds the test counts over all words and the distances to all
+        # training cases, so its row count is bounded by both together
+        nn = np.zeros(n_test, dtype=np.int64)
+        chunk_size = max(1, 2**20 // (n_words + bags.shape[0]))
+        for start in range(0, n_test, chunk_size):
+            end = min(start + chunk_size, n_test)
+            in_chunk = known & (rows >= start) & (rows < end)
+
+            test_matrix = np.zeros((end - start, n_words))
+            test_matrix[rows[in_chunk] - start, test_keys[in_chunk]] = counts[in_chunk]
+
+            dists = (
+                test_norms[start:end, None]
+                + (test_matrix > 0) @ bags_sq_t
+                - 2 * (test_matrix @ bags_t)
+            )
+            nn[start:end] = _nn_from_distances(dists, self._tie_draws(rng, end - start))
 
         return nn
 
     def _train_predict(self, train_num):
-        test_bag = self._transformed_data[train_num]
-        best_dist = sys.float_info.max
-        nn = None
-
-        for n, bag in enumerate(self._transformed_data):
-            if n == train_num:
-                continue
+        start = self._bag_indptr[train_num]
+        end = self._bag_indptr[train_num + 1]
+
+        nn = _nn_search(
+            self._bag_keys[start:end],
+            self._bag_counts[start:end],
+            self._bag_keys,
+            self._bag_counts,
+            self._bag_indptr,
+            self._bag_matrix,
+            train_num,
+            np.zeros(0),
+        )
 
-            dist = boss_distance(test_bag, bag, best_dist)
+        # with a single training case there is no nearest neighbour
+        return None if nn == -1 else self._class_vals[nn]
 
-            if dist < best_dist:
-                best_dist = dist
-                nn = self._class_vals[n]
+    def _train_predict_all(self):
+        prev_threads = get_num_threads()
+        set_num_threads(min(self._threads_to_use, config.NUMBA_NUM_THREADS))
+        try:
+            nn = _loocv_nn(
+                self._bag_keys, self._bag_counts, self._bag_indptr, self._bag_matrix
+            )
+        finally:
+            set_num_threads(prev_threads)
 
-        return nn
+        preds = np.asarray(self._class_vals)[nn]
+        # with a single training case there is no nearest neighbour
+        if (nn == -1).any():
+            preds = preds.astype(object)
+            preds[nn == -1] = None
+        return preds
 
     def _shorten_bags(self, word_len):
         new_boss = IndividualBOSS(
@@ -648,8 +700,20 @@ class IndividualBOSS(BaseClassifier):
             n_jobs=self.n_jobs,
         )
         new_boss._transformer = self._transformer
-        sfa = self._transformer._shorten_bags(word_len)
-        new_boss._transformed_data = sfa[0]
+
+        if not self._transformer.save_words:
+            raise ValueError(
+                "Words from transform must be saved using save_word to shorten bags."
+            )
+
+        # shorten the saved full length words by dropping their last letters
+        # rather than transforming the series again
+        shift = (
+            max(self._transformer.word_length - word_len, 0)
+            * self._transformer.letter_bits
+        )
+        words = np.array(self._transformer.words) >> shift
+        new_boss._set_bags(*_words_to_arrays(new_boss._word_ids(words, fit=True)))
 
         new_boss._class_vals = self._class_vals
         new_boss.n_classes_ = self.n_classes_
@@ -660,6 +724,50 @@ class IndividualBOSS(BaseClassifier):
         new_boss._is_fitted = True
         return new_boss
 
+    def _set_bags(self, words, counts, indptr):
+        self._bag_counts = counts
+        self._bag_indptr = indptr
+        n_instances = len(self._bag_indptr) - 1
+        vocabulary = np.unique(words)
+
+        # use a dense count matrix over the training words unless it would be
+        # much larger than the sparse bags, in which case keep the sorted words
+        if 0 < n_instances * len(vocabulary) <= 16 * len(words):
+            self._bag_vocabulary = vocabulary
+            self._bag_keys = np.searchsorted(vocabulary, words)
+            # counts are stored in a single byte when they fit, which cuts the
+            # memory read by the distance kernels. larger counts keep 32 bits.
+            dtype = np.uint8 if counts.max() <= np.iinfo(np.uint8).max else np.uint32
+            self._bag_matrix = np.zeros((n_instances, len(vocabulary)), dtype=dtype)
+            rows = np.repeat(np.arange(n_instances), np.diff(self._bag_indptr))
+            self._bag_matrix[rows, self._bag_keys] = self._bag_counts
+        else:
+            self._bag_vocabulary = np.zeros(0, dtype=np.int64)
+            self._bag_keys = words
+            self._bag_matrix = np.zeros((0, 0), dtype=np.uint32)
+
+    def _word_ids(self, words, fit=False):
+        # words of over 64 bits are Python ints, which the bag arrays cannot hold.
+        # they are numbered by their position in the training words instead.
+        if words.dtype != object:
+            return words
+
+        if fit:
+            self._large_word_vocabulary = np.unique(words)
+        return _large_words_to_ids(words, self._large_word_vocabulary)
+
+    def _words_to_keys(self, words):
+        if len(self._bag_vocabulary) == 0:
+            return words
+
+        # words not seen in the training bags are marked with a -1 column
+        keys = np.searchsorted(self._bag_vocabulary, words)
+        found = (
+            self._bag_vocabulary[np.minimum(keys, len(self._bag_vocabulary) - 1)]
+            == words
+        )
+        return np.where(found, keys, -1)
+
     def _clean(self):
         self._transformer.words = None
         self._transformer.save_words = False
@@ -709,12 +817,7 @@ def boss_distance(first, second, best_dist=sys.float_info.max):
     elif isinstance(first, Dict):
         return _boss_distance_dict(first, second, best_dist)
     else:
-        return np.sum(
-            [
-                0 if first[i] == 0 else (first[i] - second[i]) * (first[i] - second[i])
-                for i in range(len(first))
-            ]
-        )
+        return _boss_distance_array(np.asarray(first), np.asarray(second))
 
 
 @njit(fastmath=True, cache=True)
@@ -728,3 +831,266 @@ def _boss_distance_dict(first, second, best_dist):
         if dist > best_dist:
             return 0x7FFFFFFFFFFFFFFF
     return dist
+
+
+@njit(fastmath=True, cache=True)
+def _boss_distance_array(first, second):
+    dist = 0
+    for i in range(len(first)):
+        if first[i] != 0:
+            buf = first[i] - second[i]
+            dist += buf * buf
+    return dist
+
+
+# element types the dense training count matrix can be stored with
+_MATRIX_TYPES = ("uint8", "uint32")
+
+
+def _words_to_arrays(words):
+    """Count the words of each series into sorted CSR style arrays.
+
+    Words identical to the previous word in the series are not counted, matching
+    SFA with remove_repeat_words=True.
+    """
+    keep = np.ones(words.shape, dtype=bool)
+    keep[:, 1:] = words[:, 1:] != words[:, :-1]
+    rows, windows = np.nonzero(keep)
+    kept_words = words[rows, windows]
+
+    order = np.lexsort((kept_words, rows))
+    rows = rows[order]
+    kept_words = kept_words[order]
+
+    first = np.ones(len(kept_words), dtype=bool)
+    first[1:] = (kept_words[1:] != kept_words[:-1]) | (rows[1:] != rows[:-1])
+    starts = np.flatnonzero(first)
+
+    indptr = np.zeros(words.shape[0] + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum(np.bincount(rows[starts], minlength=words.shape[0]))
+    counts = np.diff(np.append(starts, len(kept_words))).astype(np.uint32)
+
+    return kept_words[starts].astype(np.int64), counts, indptr
+
+
+def _large_words_to_ids(words, vocabulary):
+    """Replace Python int words by int64 ids.
+
+    Words in the sorted vocabulary get their position in it, other words get
+    distinct ids after it, so equal words always share an id.
+    """
+    uniques, inverse = np.unique(words, return_inverse=True)
+    positions = np.searchsorted(vocabulary, uniques)
+    found = vocabulary[np.minimum(positions, len(vocabulary) - 1)] == uniques
+    ids = np.where(found, positions, len(vocabulary) + np.arange(len(uniques)))
+    return ids.astype(np.int64)[inverse].reshape(words.shape)
+
+
+@njit(
+    "int64(int64[:],uint32[:],int64[:],uint32[:],float64)",
+    fastmath=True,
+    cache=True,
+    nogil=True,
+)
+def _boss_distance_sorted(
+    first_words, first_counts, second_words, second_counts, best_dist
+):
+    dist = 0
+    n = 0
+    second_len = len(second_words)
+    for i in range(len(first_words)):
+        word = first_words[i]
+        while n < second_len and second_words[n] < word:
+            n += 1
+
+        buf = np.int64(first_counts[i])
+        if n < second_len and second_words[n] == word:
+            buf -= np.int64(second_counts[n])
+        dist += buf * buf
+
+        if dist > best_dist:
+            return 0x7FFFFFFFFFFFFFFF
+    return dist
+
+
+@njit(
+    [f"int64(int64[:],uint32[:],{t}[:],float64)" for t in _MATRIX_TYPES],
+    fastmath=True,
+    cache=True,
+    nogil=True,
+)
+def _boss_distance_dense(first_keys, first_counts, second_row, best_dist):
+    dist = 0
+    for i in range(len(first_keys)):
+        buf = np.int64(first_counts[i])
+        if first_keys[i] >= 0:
+            buf -= np.int64(second_row[first_keys[i]])
+        dist += buf * buf
+
+        if dist > best_dist:
+            return 0x7FFFFFFFFFFFFFFF
+    return dist
+
+
+@njit(
+    [f"int64(uint32[:],int64,{t}[:])" for t in _MATRIX_TYPES],
+    fastmath=True,
+    cache=True,
+    nogil=True,
+)
+def _boss_distance_row(first_row, first_extra, second_row):
+    dist = first_extra
+    for i in range(len(first_row)):
+        buf = np.int64(first_row[i]) - np.int64(second_row[i])
+        dist += (first_row[i] > 0) * buf * buf
+    return dist
+
+
+@njit(
+    [
+        f"int64(int64[:],uint32[:],int64[:],uint32[:],int64[:],{t}[:,:],int64,"
+        "float64[:])"
+        for t in _MATRIX_TYPES
+    ],
+    fastmath=True,
+    cache=True,
+    nogil=True,
+)
+def _nn_search(
+    test_keys,
+    test_counts,
+    bag_keys,
+    bag_counts,
+    bag_indptr,
+    bag_matrix,
+    skip,
+    tie_rand,
+):
+    best_dist = np.finfo(np.float64).max
+    nn = -1
+    ties = 0
+    dense = bag_matrix.shape[0] > 0
+
+    # densely filled test bags are expanded to a full row, so the distance can be
+    # computed over whole rows without the early abandon branch
+    full_row = dense and len(test_keys) > 0.2 * bag_matrix.shape[1]
+    if full_row:
+        test_row = np.zeros(bag_matrix.shape[1], dtype=np.uint32)
+        test_extra = 0
+        for i in range(len(test_keys)):
+            if test_keys[i] >= 0:
+                test_row[test_keys[i]] = test_counts[i]
+            else:
+                test_extra += np.int64(test_counts[i]) * np.int64(test_counts[i])
+
+    for n in range(len(bag_indptr) - 1):
+        if n == skip:
+            continue
+
+        if full_row:
+            dist = _boss_distance_row(test_row, test_extra, bag_matrix[n])
+        elif dense:
+            dist = _boss_distance_dense(
+                test_keys, test_counts, bag_matrix[n], best_dist
+            )
+        else:
+            dist = _boss_distance_sorted(
+                test_keys,
+                test_counts,
+                bag_keys[bag_indptr[n] : bag_indptr[n + 1]],
+                bag_counts[bag_indptr[n] : bag_indptr[n + 1]],
+                best_dist,
+            )
+
+        if dist < best_dist:
+            best_dist = dist
+            nn = n
+        elif dist == best_dist and ties < len(tie_rand):
+            ties += 1
+            if tie_rand[ties - 1] < 0.5:
+                nn = n
+
+    return nn
+
+
+@njit(
+    [
+        f"int64[:](int64[:],uint32[:],int64[:],int64[:],uint32[:],int64[:],{t}[:,:],"
+        "float64[:,:])"
+        for t in _MATRIX_TYPES
+    ],
+    fastmath=True,
+    cache=True,
+    nogil=True,
+)
+def _nn_predict(
+    test_keys,
+    test_counts,
+    test_indptr,
+    bag_keys,
+    bag_counts,
+    bag_indptr,
+    bag_matrix,
+    tie_rand,
+):
+    nn = np.zeros(len(test_indptr) - 1, dtype=np.int64)
+    for i in range(len(nn)):
+        nn[i] = _nn_search(
+            test_keys[test_indptr[i] : test_indptr[i + 1]],
+            test_counts[test_indptr[i] : test_indptr[i + 1]],
+            bag_keys,
+            bag_counts,
+            bag_indptr,
+            bag_matrix,
+            -1,
+            tie_rand[min(i, tie_rand.shape[0] - 1)],
+        )
+    return nn
+
+
+@njit(
+    [f"int64[:](int64[:],uint32[:],int64[:],{t}[:,:])" for t in _MATRIX_TYPES],
+    fastmath=True,
+    cache=True,
+    nogil=True,
+    parallel=True,
+)
+def _loocv_nn(bag_keys, bag_counts, bag_indptr, bag_matrix):
+    nn = np.zeros(len(bag_indptr) - 1, dtype=np.int64)
+    for i in prange(len(nn)):
+        nn[i] = _nn_search(
+            bag_keys[bag_indptr[i] : bag_indptr[i + 1]],
+            bag_counts[bag_indptr[i] : bag_indptr[i + 1]],
+            bag_keys,
+            bag_counts,
+            bag_indptr,
+            bag_matrix,
+            i,
+            np.zeros(0),
+        )
+    return nn
+
+
+@njit(
+    "int64[:](float64[:,:],float64[:,:])",
+    fastmath=True,
+    cache=True,
+    nogil=True,
+)
+def _nn_from_distances(distances, tie_rand):
+    nn = np.zeros(distances.shape[0], dtype=np.int64)
+    for i in range(distances.shape[0]):
+        best_dist = np.finfo(np.float64).max
+        nn[i] = -1
+        ties = 0
+        case_rand = tie_rand[min(i, tie_rand.shape[0] - 1)]
+
+        for n in range(distances.shape[1]):
+            if distances[i, n] < best_dist:
+                best_dist = distances[i, n]
+                nn[i] = n
+            elif distances[i, n] == best_dist and ties < len(case_rand):
+                ties += 1
+                if case_rand[ties - 1] < 0.5:
+                    nn[i] = n
+    return nn
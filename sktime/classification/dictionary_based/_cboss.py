@@ -63,10 +63,9 @@ class ContractableBOSS(BaseClassifier):
         Max number of parameter combinations to consider when time_limit_in_minutes is
         set.
     typed_dict : bool, default=True
-        Use a numba TypedDict to store word counts. May increase memory usage, but will
-        be faster for larger datasets. As the Dict cannot be pickled currently, there
-        will be some overhead converting it to a python dict with multiple threads and
-        pickling.
+        Passed to the SFA transform. If True, words must fit in 64 bits, which limits
+        word length times bits per letter. If False, larger words are also supported,
+        but are slower to transform. Word counts are always stored in numpy arrays.
     save_train_predictions : bool, default=False
         Save the ensemble member train predictions in fit for use in _get_train_probs
         leave-one-out cross-validation.
@@ -204,7 +203,9 @@ class ContractableBOSS(BaseClassifier):
 
         # Window length parameter space dependent on series length
         max_window_searches = self.series_length_ / 4
-        max_window = int(self.series_length_ * self.max_win_len_prop)
+        max_window = min(
+            int(self.series_length_ * self.max_win_len_prop), self.series_length_
+        )
         win_inc = int((max_window - self.min_window) / max_window_searches)
         if win_inc < 1:
             win_inc = 1
@@ -334,7 +335,7 @@ class ContractableBOSS(BaseClassifier):
             for i in range(0, X.shape[0]):
                 sums[i, self._class_dictionary[preds[i]]] += self.weights_[n]
 
-        dists = sums / (np.ones(self.n_classes_) * self._weight_sum)
+        dists = sums / self._weight_sum
 
         return dists
 
@@ -389,17 +390,18 @@ class ContractableBOSS(BaseClassifier):
             )
 
             for n, pred in enumerate(preds):
+                # instances without a nearest neighbour have no prediction
+                if pred is None:
+                    continue
                 results[subsample[n]][self._class_dictionary[pred]] += self.weights_[i]
                 divisors[subsample[n]] += self.weights_[i]
 
-        for i in range(n_instances):
-            results[i] = (
-                np.ones(self.n_classes_) * (1 / self.n_classes_)
-                if divisors[i] == 0
-                else results[i] / (np.ones(self.n_classes_) * divisors[i])
-            )
+        # instances without any votes are given equal class probabilities
+        unvoted = divisors == 0
+        results[unvoted] = 1 / self.n_classes_
+        divisors[unvoted] = 1
 
-        return results
+        return results / divisors[:, None]
 
     def _individual_train_acc(self, boss, y, train_size, lowest_acc):
         correct = 0
@@ -5,6 +5,7 @@ from numpy import testing
 from sklearn.metrics import accuracy_score
 
 from sktime.classification.dictionary_based import BOSSEnsemble, IndividualBOSS
+from sktime.classification.dictionary_based._boss import _words_to_arrays, boss_distance
 from sktime.datasets import load_unit_test
 
 
@@ -48,6 +49,119 @@ def test_individual_boss_on_unit_test():
     )
 
 
+def test_boss_threaded_predict_proba():
+    """Test BOSS predictions are the same with and without threads."""
+    # load unit test data
+    X_train, y_train = load_unit_test(split="train")
+    X_test, y_test = load_unit_test(split="test")
+    indices = np.random.RandomState(0).choice(len(y_train), 10, replace=False)
+
+    # train BOSS, then predict with one and with two jobs
+    boss = BOSSEnsemble(max_ensemble_size=5, random_state=0, n_jobs=2)
+    boss.fit(X_train, y_train)
+    probas = boss.predict_proba(X_test.iloc[indices])
+
+    boss._threads_to_use = 1
+    testing.assert_array_equal(probas, boss.predict_proba(X_test.iloc[indices]))
+
+
+def test_boss_window_sizes_within_series_length():
+    """Test BOSS windows do not exceed the series length."""
+    # load unit test data
+    X_train, y_train = load_unit_test(split="train")
+    series_length = X_train.iloc[0, 0].size
+
+    # train BOSS with a max window proportion above 1
+    boss = BOSSEnsemble(max_win_len_prop=1.5, random_state=0)
+    boss.fit(X_train, y_train)
+
+    assert max(clf.window_size for clf in boss.estimators_) <= series_length
+
+
+def test_individual_boss_train_predict_single_case():
+    """Test a single training case has no leave-one-out prediction."""
+    # load unit test data
+    X_train, y_train = load_unit_test(split="train")
+
+    # train IndividualBOSS on one case, which has no nearest neighbour
+    indiv_boss = IndividualBOSS(window_size=10, random_state=0)
+    indiv_boss.fit(X_train.iloc[:1], y_train[:1])
+
+    assert indiv_boss._train_predict(0) is None
+    assert indiv_boss._train_predict_all()[0] is None
+
+
+def test_individual_boss_large_words():
+    """Test IndividualBOSS with words of more than 64 bits and no typed dict."""
+    # load unit test data
+    X_train, y_train = load_unit_test(split="train")
+    X_test, y_test = load_unit_test(split="test")
+
+    # train IndividualBOSS with 80 bit words
+    indiv_boss = IndividualBOSS(
+        window_size=20, word_length=20, alphabet_size=16, typed_dict=False
+    )
+    indiv_boss.fit(X_train, y_train)
+    assert indiv_boss._transformer.word_bits > 64
+
+    probas = indiv_boss.predict_proba(X_test)
+    testing.assert_array_almost_equal(probas.sum(axis=1), np.ones(len(y_test)))
+
+
+def test_individual_boss_large_word_ids():
+    """Test Python int words give the same predictions as int64 words."""
+    # load unit test data
+    X_train, y_train = load_unit_test(split="train")
+    X_test, y_test = load_unit_test(split="test")
+
+    indiv_boss = IndividualBOSS(window_size=10, random_state=0)
+    indiv_boss.fit(X_train, y_train)
+    probas = indiv_boss.predict_proba(X_test)
+
+    # pretend the words are too large for int64, so they are built as Python ints
+    indiv_boss._transformer.word_bits = 65
+    words = indiv_boss._transformer._transform_words(X_train)
+    assert words.dtype == object
+    indiv_boss._set_bags(*_words_to_arrays(indiv_boss._word_ids(words, fit=True)))
+
+    testing.assert_array_equal(indiv_boss.predict_proba(X_test), probas)
+
+
+def test_individual_boss_tie_draws():
+    """Test tie draws are shared for int seeds and fresh per case otherwise."""
+    # load unit test data
+    X_train, y_train = load_unit_test(split="train")
+    n_train = len(y_train)
+
+    # an int seed gives every test case the draws of a freshly seeded generator
+    indiv_boss = IndividualBOSS(window_size=10, random_state=0)
+    indiv_boss.fit(X_train, y_train)
+    draws = indiv_boss._tie_draws(None, 5)
+    testing.assert_array_equal(
+        draws, np.random.RandomState(0).random_sample((1, n_train))
+    )
+
+    # a generator moves on, so each test case draws values of its own
+    rng = np.random.RandomState(0)
+    indiv_boss.random_state = rng
+    draws = indiv_boss._tie_draws(rng, 5)
+    assert draws.shape == (5, n_train)
+    assert not np.array_equal(draws[0], draws[1])
+
+
+def test_boss_distance_dict_and_array():
+    """Test the BOSS distance is the same for dictionary and array histograms."""
+    first = {0: 3, 2: 1, 5: 2}
+    second = {0: 1, 1: 4, 5: 5}
+    first_array = np.array([3, 0, 1, 0, 0, 2], dtype=np.uint32)
+    second_array = np.array([1, 4, 0, 0, 0, 5], dtype=np.uint32)
+
+    # only words in the first histogram are counted
+    assert boss_distance(first, second) == 14
+    assert boss_distance(first_array, second_array) == 14
+    assert boss_distance(second_array, first_array) == 29
+
+
 boss_unit_test_probas = np.array(
     [
         [
@@ -6,6 +6,8 @@ __author__ = ["fkiraly"]
 from sktime.datatypes._check import (
     check_is,
     check_is_mtype,
+    check_is_mtype_fast,
+    check_is_mtype_many,
     check_is_scitype,
     check_raise,
     mtype,
@@ -25,6 +27,8 @@ from sktime.datatypes._vectorize import VectorizedDF
 __all__ = [
     "check_is",
     "check_is_mtype",
+    "check_is_mtype_fast",
+    "check_is_mtype_many",
     "check_is_scitype",
     "check_raise",
     "convert",
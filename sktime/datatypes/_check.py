@@ -8,6 +8,12 @@ check_is_mtype(obj, mtype: str, scitype: str)
     checks whether obj is mtype for scitype
     returns boolean yes/no and metadata
 
+check_is_mtype_fast(obj, mtype: str, scitype: str)
+    same as check_is_mtype for a single mtype with known scitype, but faster
+
+check_is_mtype_many(objs, mtype: str, scitype: str)
+    same as check_is_mtype for each element of the list objs
+
 check_raise(obj, mtype: str, scitype:str)
     checks whether obj is mtype for scitype
     returns True if passes, otherwise raises error
@@ -20,15 +26,19 @@ __author__ = ["fkiraly"]
 
 __all__ = [
     "check_is_mtype",
+    "check_is_mtype_fast",
+    "check_is_mtype_many",
     "check_raise",
     "mtype",
 ]
 
+import os
+import sys
+import warnings
+import weakref
+from functools import lru_cache, wraps
 from typing import List, Union
 
-import numpy as np
-from deprecated.sphinx import deprecated
-
 from sktime.datatypes._alignment import check_dict_Alignment
 from sktime.datatypes._hierarchical import check_dict_Hierarchical
 from sktime.datatypes._panel import check_dict_Panel
@@ -44,15 +54,59 @@ check_dict.update(check_dict_Hierarchical)
 check_dict.update(check_dict_Alignment)
 check_dict.update(check_dict_Table)
 
+# intern the key strings, so that lookups with strings taken from the keys, e.g.,
+#  mtypes returned by mtype, compare by identity
+check_dict = {(sys.intern(k[0]), sys.intern(k[1])): v for k, v in check_dict.items()}
+
+# (mtype, scitype) keys and scitypes with a check, computed once rather than on
+#  every check, check_dict is not changed after import
+_VALID_KEYS = frozenset(check_dict.keys())
+_ALL_KEYS = tuple(check_dict.keys())
+_VALID_SCITYPES = frozenset(x[1] for x in _VALID_KEYS)
+
+# check_dict keys grouped by scitype, scitypes in order of appearance in check_dict
+_SCITYPE_TO_KEYS = dict()
+for _key in check_dict.keys():
+    _SCITYPE_TO_KEYS.setdefault(_key[1], []).append(_key)
+_SCITYPE_TO_KEYS = {x: tuple(keys) for x, keys in _SCITYPE_TO_KEYS.items()}
+
+
+def _keys_for_scitypes(scitypes):
+    """Return the check_dict keys of any scitype in scitypes, grouped by scitype."""
+    return [
+        key for x, keys in _SCITYPE_TO_KEYS.items() if x in scitypes for key in keys
+    ]
+
+
+@lru_cache(maxsize=None)
+def _mtype_to_scitype_cached(mtype: str):
+    """Infer scitype belonging to mtype, cached as the mtype strings are fixed."""
+    return mtype_to_scitype(mtype)
+
+
+@lru_cache(maxsize=None)
+def _meta_pair(mtype: str, scitype: str):
+    """Return the mtype/scitype metadata entries, cached per pair, do not mutate."""
+    return {"mtype": mtype, "scitype": scitype}
+
+
+def _warm_check_dict():
+    """Fill the caches used by the checks, so first calls pay no lookup cost."""
+    for key in check_dict.keys():
+        _mtype_to_scitype_cached(key[0])
+
+
+# warming at import is opt-in, as it slows down the import for all other users
+if os.environ.get("SKTIME_WARM_CHECKS") == "1":
+    _warm_check_dict()
+
 
 def _check_scitype_valid(scitype: str = None):
     """Check validity of scitype."""
-    valid_scitypes = list(set([x[1] for x in check_dict.keys()]))
-
     if not isinstance(scitype, str):
         raise TypeError(f"scitype should be a str but found {type(scitype)}")
 
-    if scitype is not None and scitype not in valid_scitypes:
+    if scitype not in _VALID_SCITYPES:
         raise TypeError(scitype + " is not a supported scitype")
 
 
@@ -63,15 +117,10 @@ def _ret(valid, msg, metadata, return_metadata):
         return valid
 
 
-#  TODO: remove in v0.11.0
-@deprecated(
-    version="v0.10.0",
-    reason=(
-        "check_is is deprecated since v0.10.0 and will be removed in v0.11.0."
-        "Please use check_is_mtype instead."
-    ),
-    category=FutureWarning,
-)
+#  TODO: remove in v0.11.0, together with _check_is_warned
+_check_is_warned = False
+
+
 def check_is(
     obj,
     mtype: Union[str, List[str]],
@@ -81,6 +130,9 @@ def check_is(
 ):
     """Check object for compliance with mtype specification, return metadata.
 
+    .. deprecated:: v0.10.0
+        check_is will be removed in v0.11.0, use check_is_mtype instead.
+
     Parameters
     ----------
     obj - object to check
@@ -129,6 +181,17 @@ def check_is(
     TypeError if no checks defined for mtype/scitype combination
     TypeError if mtype input argument is not of expected type
     """
+    # warn on first call only, check_is is a plain passthrough otherwise
+    global _check_is_warned
+    if not _check_is_warned:
+        warnings.warn(
+            "check_is is deprecated since v0.10.0 and will be removed in v0.11.0. "
+            "Please use check_is_mtype instead.",
+            FutureWarning,
+            stacklevel=2,
+        )
+        _check_is_warned = True
+
     return check_is_mtype(
         obj=obj,
         mtype=mtype,
@@ -138,6 +201,76 @@ def check_is(
     )
 
 
+def _cache_by_identity(check_fun):
+    """Cache results of check_fun by identity of the checked object, opt-in.
+
+    Caching is only switched on if the environment variable SKTIME_CHECK_CACHE is
+    "1" at import, otherwise check_fun is returned unchanged.
+    Results are cached for objects that can be weakly referenced, under the id of
+    the object, and for array-like objects also the data pointer and shape.
+    Entries are removed when the object is garbage collected.
+    Note: in-place changes to values of a cached object are not detected.
+
+    Parameters
+    ----------
+    check_fun : function with signature of check_is_mtype
+
+    Returns
+    -------
+    check_fun, or function with same signature that caches results of check_fun
+    """
+    if os.environ.get("SKTIME_CHECK_CACHE") != "1":
+        return check_fun
+
+    cache = dict()
+
+    @wraps(check_fun)
+    def cached_check_fun(
+        obj, mtype, scitype=None, return_metadata=False, var_name="obj"
+    ):
+        if isinstance(mtype, list) and all(isinstance(m, str) for m in mtype):
+            mtype_key = tuple(mtype)
+        elif isinstance(mtype, str):
+            mtype_key = mtype
+        else:
+            # invalid mtype, leave raising the error to check_fun
+            return check_fun(obj, mtype, scitype, return_metadata, var_name)
+
+        if scitype is not None and not isinstance(scitype, str):
+            # invalid scitype, leave raising the error to check_fun
+            return check_fun(obj, mtype, scitype, return_metadata, var_name)
+
+        key = (id(obj), mtype_key, scitype, return_metadata, var_name)
+        array_interface = getattr(obj, "__array_interface__", None)
+        if isinstance(array_interface, dict):
+            key += (array_interface["data"][0], array_interface["shape"])
+
+        # the reference guards against a new object re-using the id of a dead one
+        cached = cache.get(key)
+        if cached is not None and cached[0]() is obj:
+            return _copy_result(cached[1], return_metadata)
+
+        result = check_fun(obj, mtype, scitype, return_metadata, var_name)
+
+        try:
+            ref = weakref.ref(obj, lambda _, key=key: cache.pop(key, None))
+        except TypeError:
+            return result
+        cache[key] = (ref, _copy_result(result, return_metadata))
+
+        return result
+
+    cached_check_fun._cache = cache
+    return cached_check_fun
+
+
+def _copy_result(result, return_metadata):
+    """Copy the metadata dict of a check result, as callers may change it."""
+    if return_metadata and result[2] is not None:
+        return result[0], result[1], dict(result[2])
+    return result
+
+
 def _coerce_list_of_str(obj, var_name="obj"):
     """Check whether object is string or list of string.
 
@@ -159,7 +292,7 @@ def _coerce_list_of_str(obj, var_name="obj"):
     if isinstance(obj, str):
         obj = [obj]
     elif isinstance(obj, list):
-        if not np.all([isinstance(x, str) for x in obj]):
+        if not all(isinstance(x, str) for x in obj):
             raise TypeError(f"{var_name} must be a string or list of strings")
     else:
         raise TypeError(f"{var_name} must be a string or list of strings")
@@ -167,6 +300,7 @@ def _coerce_list_of_str(obj, var_name="obj"):
     return obj
 
 
+@_cache_by_identity
 def check_is_mtype(
     obj,
     mtype: Union[str, List[str]],
@@ -226,27 +360,75 @@ def check_is_mtype(
     TypeError if no checks defined for mtype/scitype combination
     TypeError if mtype input argument is not of expected type
     """
-    mtype = _coerce_list_of_str(mtype, var_name="mtype")
+    # fast path for a single mtype with known scitype and no metadata,
+    #  which needs no coercion, inference or ambiguity check
+    #  unknown combinations fall through, to raise the usual errors below
+    if not return_metadata and isinstance(mtype, str) and isinstance(scitype, str):
+        check_fun = check_dict.get((mtype, scitype))
+        if check_fun is not None:
+            return bool(check_fun(obj, return_metadata=False, var_name=var_name))
 
-    valid_keys = check_dict.keys()
+    entries = _resolve_check_entries(mtype, scitype)
 
-    # we loop through individual mtypes in mtype and see whether they pass the check
-    #  for each check we remember whether it passed and what it returned
-    msg = []
-    found_mtype = []
-    found_scitype = []
+    return _check_one(obj, entries, return_metadata, var_name)
+
+
+def _resolve_check_entries(mtype, scitype):
+    """Coerce and validate check_is_mtype arguments, resolve the check functions.
+
+    Parameters
+    ----------
+    mtype: str or list of str, mtype(s) to check as
+    scitype: str or None, scitype to check as; default = inferred from mtype
+
+    Returns
+    -------
+    entries: list of (mtype, scitype, check function) tuples, one per mtype
+
+    Raises
+    ------
+    TypeError if no checks defined for mtype/scitype combination
+    TypeError if mtype input argument is not of expected type
+    """
+    mtype = _coerce_list_of_str(mtype, var_name="mtype")
+
+    if scitype is not None:
+        _check_scitype_valid(scitype)
 
+    entries = []
     for m in mtype:
-        if scitype is None:
-            scitype_of_m = mtype_to_scitype(m)
-        else:
-            _check_scitype_valid(scitype)
-            scitype_of_m = scitype
+        # scitype was validated above, only inferred scitypes need looking up
+        scitype_of_m = scitype if scitype is not None else _mtype_to_scitype_cached(m)
         key = (m, scitype_of_m)
-        if (m, scitype_of_m) not in valid_keys:
+        if key not in _VALID_KEYS:
             raise TypeError(f"no check defined for mtype {m}, scitype {scitype_of_m}")
+        entries.append((m, scitype_of_m, check_dict[key]))
 
-        res = check_dict[key](obj, return_metadata=return_metadata, var_name=var_name)
+    return entries
+
+
+def _check_one(obj, entries, return_metadata, var_name):
+    """Check obj against resolved entries, return as check_is_mtype.
+
+    Parameters
+    ----------
+    obj - object to check
+    entries: list of (mtype, scitype, check function), from _resolve_check_entries
+    return_metadata - bool, whether to return msg and metadata
+    var_name: str, name of input in error messages
+
+    Returns
+    -------
+    same as check_is_mtype
+    """
+    # we loop through individual mtypes in mtype and see whether they pass the check
+    #  for each check we remember whether it passed and what it returned
+    msg = [] if return_metadata else None
+    found_mtype = None
+    found_scitype = None
+
+    for m, scitype_of_m, check_fun in entries:
+        res = check_fun(obj, return_metadata=return_metadata, var_name=var_name)
 
         if return_metadata:
             check_passed = res[0]
@@ -254,36 +436,153 @@ def check_is_mtype(
             check_passed = res
 
         if check_passed:
-            found_mtype.append(m)
-            found_scitype.append(scitype_of_m)
+            # without metadata, the first passing check is the answer, the
+            #  ambiguity check below only runs when metadata is collected
+            if not return_metadata:
+                return True
+            # a second mtype is unexpected and an error with checks, raise at once
+            if found_mtype is not None:
+                raise TypeError(
+                    "Error in check_is_mtype, more than one mtype identified: "
+                    f"{[found_mtype, m]}"
+                )
+            found_mtype = m
+            found_scitype = scitype_of_m
             final_result = res
-        elif return_metadata:
+        elif msg is not None:
             msg.append(res[1])
 
-    # there are three options on the result of check_is_mtype:
-    # a. two or more mtypes are found - this is unexpected and an error with checks
-    if len(found_mtype) > 1:
-        raise TypeError(
-            f"Error in check_is_mtype, more than one mtype identified: {found_mtype}"
-        )
-    # b. one mtype is found - then return that mtype
-    elif len(found_mtype) == 1:
-        if return_metadata:
-            # add the mtype return to the metadata
-            final_result[2]["mtype"] = found_mtype[0]
-            final_result[2]["scitype"] = found_scitype[0]
-            # final_result already has right shape and dependency on return_metadata
-            return final_result
-        else:
-            return True
-    # c. no mtype is found - then return False and all error messages if requested
+    # there are two options on the result of check_is_mtype:
+    # a. one mtype is found - then return that mtype with metadata
+    if found_mtype is not None:
+        # add the mtype and scitype return to the metadata
+        final_result[2].update(_meta_pair(found_mtype, found_scitype))
+        # final_result already has right shape and dependency on return_metadata
+        return final_result
+    # b. no mtype is found - then return False and all error messages if requested
     else:
-        if len(msg) == 1:
+        if msg is not None and len(msg) == 1:
             msg = msg[0]
 
         return _ret(False, msg, None, return_metadata)
 
 
+def check_is_mtype_many(
+    objs,
+    mtype: Union[str, List[str]],
+    scitype: str = None,
+    return_metadata=False,
+    var_name="obj",
+):
+    """Check a list of objects for compliance with mtype specification.
+
+    Same as calling check_is_mtype on each element of objs, but argument
+    coercion, scitype validation and check lookup are done only once.
+
+    Parameters
+    ----------
+    objs - list of objects to check
+    mtype: str or list of str, mtype to check objects as
+        valid mtype strings are in datatypes.MTYPE_REGISTER (1st column)
+    scitype: str, optional, scitype to check objects as; default = inferred from mtype
+        valid mtype strings are in datatypes.SCITYPE_REGISTER (1st column)
+    return_metadata - bool, optional, default=False
+        if False, returns only "valid" return per object
+        if True, returns all three return objects per object
+    var_name: str, optional, default="obj" - name of inputs in error messages
+
+    Returns
+    -------
+    list of same length as objs, i-th element is
+        check_is_mtype(objs[i], mtype, scitype, return_metadata, var_name)
+
+    Raises
+    ------
+    TypeError if no checks defined for mtype/scitype combination
+    TypeError if mtype input argument is not of expected type
+    """
+    entries = _resolve_check_entries(mtype, scitype)
+
+    return [_check_one(obj, entries, return_metadata, var_name) for obj in objs]
+
+
+@lru_cache(maxsize=None)
+def _compile_checker(mtype: str, scitype: str, return_metadata: bool):
+    """Return a check function specialized to mtype, scitype and return_metadata.
+
+    Parameters
+    ----------
+    mtype: str, mtype to check obj as
+    scitype: str, scitype to check obj as
+    return_metadata - bool, whether the check function returns metadata
+
+    Returns
+    -------
+    checker: function with signature checker(obj, var_name="obj")
+        returning the same as check_is_mtype(obj, mtype, scitype, return_metadata)
+
+    Raises
+    ------
+    TypeError if no checks defined for mtype/scitype combination
+    """
+    if (mtype, scitype) not in _VALID_KEYS:
+        raise TypeError(f"no check defined for mtype {mtype}, scitype {scitype}")
+
+    check_fun = check_dict[(mtype, scitype)]
+
+    if not return_metadata:
+
+        def checker(obj, var_name="obj"):
+            return bool(check_fun(obj, return_metadata=False, var_name=var_name))
+
+    else:
+
+        def checker(obj, var_name="obj"):
+            valid, msg, metadata = check_fun(
+                obj, return_metadata=True, var_name=var_name
+            )
+            if not valid:
+                # as check_is_mtype, no metadata is returned for invalid objects
+                return valid, msg, None
+            metadata.update(_meta_pair(mtype, scitype))
+            return valid, msg, metadata
+
+    return checker
+
+
+def check_is_mtype_fast(
+    obj, mtype: str, scitype: str, return_metadata=False, var_name="obj"
+):
+    """Check object for compliance with a single mtype of known scitype.
+
+    Same as check_is_mtype for str mtype and scitype, but without coercion of
+    arguments, scitype inference or ambiguity checks, the check is looked up once
+    per mtype, scitype and return_metadata, and then reused.
+    Intended for repeated checks against a fixed mtype, e.g., inside loops.
+
+    Parameters
+    ----------
+    obj - object to check
+    mtype: str, mtype to check obj as
+        valid mtype strings are in datatypes.MTYPE_REGISTER (1st column)
+    scitype: str, scitype to check obj as
+        valid mtype strings are in datatypes.SCITYPE_REGISTER (1st column)
+    return_metadata - bool, optional, default=False
+        if False, returns only "valid" return
+        if True, returns all three return objects
+    var_name: str, optional, default="obj" - name of input in error messages
+
+    Returns
+    -------
+    same as check_is_mtype(obj, mtype, scitype, return_metadata, var_name)
+
+    Raises
+    ------
+    TypeError if no checks defined for mtype/scitype combination
+    """
+    return _compile_checker(mtype, scitype, return_metadata)(obj, var_name=var_name)
+
+
 def check_raise(obj, mtype: str, scitype: str = None, var_name: str = "input"):
     """Check object for compliance with mtype specification, raise errors.
 
@@ -310,18 +609,26 @@ def check_raise(obj, mtype: str, scitype: str = None, var_name: str = "input"):
     ValueError if mtype input argument is not of expected type
     """
     obj_long_name_for_avoiding_linter_clash = obj
-    valid, msg, _ = check_is_mtype(
+
+    # metadata is only needed for the error message, so it is only collected
+    #  once the object is known to fail the check
+    if check_is_mtype(
+        obj=obj_long_name_for_avoiding_linter_clash,
+        mtype=mtype,
+        scitype=scitype,
+        return_metadata=False,
+        var_name=var_name,
+    ):
+        return True
+
+    _, msg, _ = check_is_mtype(
         obj=obj_long_name_for_avoiding_linter_clash,
         mtype=mtype,
         scitype=scitype,
         return_metadata=True,
         var_name=var_name,
     )
-
-    if valid:
-        return True
-    else:
-        raise TypeError(msg)
+    raise TypeError(msg)
 
 
 def mtype(obj, as_scitype: Union[str, List[str]] = None):
@@ -356,22 +663,21 @@ def mtype(obj, as_scitype: Union[str, List[str]] = None):
             _check_scitype_valid(scitype)
 
     if as_scitype is None:
-        m_plus_scitypes = [(x[0], x[1]) for x in check_dict.keys()]
+        m_plus_scitypes = _ALL_KEYS
     else:
-        m_plus_scitypes = [
-            (x[0], x[1]) for x in check_dict.keys() if x[1] in as_scitype
-        ]
-
-    res = [
-        m_plus_scitype[0]
-        for m_plus_scitype in m_plus_scitypes
-        if check_is_mtype(obj, mtype=m_plus_scitype[0], scitype=m_plus_scitype[1])
-    ]
+        m_plus_scitypes = _keys_for_scitypes(as_scitype)
 
-    if len(res) > 1:
-        raise TypeError(
-            f"Error in check_is_mtype, more than one mtype identified: {res}"
-        )
+    # the checks are called directly, the keys are known to be valid
+    res = []
+    for key in m_plus_scitypes:
+        if check_dict[key](obj, return_metadata=False, var_name="obj"):
+            res.append(key[0])
+
+            # two identified mtypes are already an error, no need to check further
+            if len(res) > 1:
+                raise TypeError(
+                    f"Error in check_is_mtype, more than one mtype identified: {res}"
+                )
 
     if len(res) < 1:
         raise TypeError("No valid mtype could be identified")
@@ -439,15 +745,12 @@ def check_is_scitype(
     for x in scitype:
         _check_scitype_valid(x)
 
-    valid_keys = check_dict.keys()
-
     # find all the mtype keys corresponding to the scitypes
-    keys = [x for x in valid_keys if x[1] in scitype]
+    keys = _keys_for_scitypes(scitype)
 
     # storing the msg retursn
-    msg = []
-    found_mtype = []
-    found_scitype = []
+    msg = [] if return_metadata else None
+    found_key = None
 
     for key in keys:
         res = check_dict[key](obj, return_metadata=return_metadata, var_name=var_name)
@@ -458,32 +761,31 @@ def check_is_scitype(
             check_passed = res
 
         if check_passed:
+            # without metadata, the first passing check is the answer, the
+            #  ambiguity check below only runs when metadata is collected
+            if not return_metadata:
+                return True
+            # a second mtype is unexpected and an error with checks, raise at once
+            if found_key is not None:
+                raise TypeError(
+                    "Error in check_is_mtype, more than one mtype identified: "
+                    f"{[found_key[0], key[0]]}"
+                )
             final_result = res
-            found_mtype.append(key[0])
-            found_scitype.append(key[1])
-        elif return_metadata:
+            found_key = key
+        elif msg is not None:
             msg.append(res[1])
 
-    # there are three options on the result of check_is_mtype:
-    # a. two or more mtypes are found - this is unexpected and an error with checks
-    if len(found_mtype) > 1:
-        raise TypeError(
-            f"Error in check_is_mtype, more than one mtype identified: {found_mtype}"
-        )
-    # b. one mtype is found - then return that mtype
-    elif len(found_mtype) == 1:
-        if return_metadata:
-            # add the mtype return to the metadata
-            final_result[2]["mtype"] = found_mtype[0]
-            # add the scitype return to the metadata
-            final_result[2]["scitype"] = found_scitype[0]
-            # final_result already has right shape and dependency on return_metadata
-            return final_result
-        else:
-            return True
-    # c. no mtype is found - then return False and all error messages if requested
+    # there are two options on the result of check_is_mtype:
+    # a. one mtype is found - then return that mtype with metadata
+    if found_key is not None:
+        # add the mtype and scitype return to the metadata
+        final_result[2].update(_meta_pair(*found_key))
+        # final_result already has right shape and dependency on return_metadata
+        return final_result
+    # b. no mtype is found - then return False and all error messages if requested
     else:
-        if len(msg) == 1:
+        if msg is not None and len(msg) == 1:
             msg = msg[0]
 
         return _ret(False, msg, None, return_metadata)
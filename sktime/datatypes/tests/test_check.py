@@ -3,10 +3,20 @@
 
 __author__ = ["fkiraly"]
 
+import gc
+
 import numpy as np
+import pytest
 
 from sktime.datatypes import MTYPE_REGISTER, SCITYPE_REGISTER
-from sktime.datatypes._check import check_dict, check_is_mtype
+from sktime.datatypes._check import (
+    _cache_by_identity,
+    check_dict,
+    check_is,
+    check_is_mtype,
+    check_is_mtype_fast,
+    check_is_mtype_many,
+)
 from sktime.datatypes._check import mtype as infer_mtype
 from sktime.datatypes._examples import get_examples
 
@@ -270,3 +280,145 @@ def test_mtype_infer(scitype, mtype, fixture_index):
         assert mtype == infer_mtype(
             fixture, as_scitype=scitype
         ), f"mtype {mtype} not correctly identified for fixture {fixture_index}"
+
+
+def test_check_is_mtype_fast(scitype, mtype, fixture_index):
+    """Tests that check_is_mtype_fast agrees with check_is_mtype on examples.
+
+    Parameters
+    ----------
+    scitype : str - name of scitype for which mtype conversions are tested
+
+    Raises
+    ------
+    AssertionError if check_is_mtype_fast and check_is_mtype returns differ
+    error if check itself raises an error
+    """
+    # retrieve fixture for checking
+    fixture = get_examples(mtype=mtype, as_scitype=scitype).get(fixture_index)
+
+    # todo: possibly remove this once all checks are defined
+    check_is_defined = (mtype, scitype) in check_dict.keys()
+
+    # check fixtures that exist against checks that exist
+    if fixture is not None and check_is_defined:
+        assert check_is_mtype_fast(fixture, mtype, scitype) == check_is_mtype(
+            fixture, mtype, scitype
+        )
+        fast_result = check_is_mtype_fast(fixture, mtype, scitype, True)
+        result = check_is_mtype(fixture, mtype, scitype, True)
+        assert fast_result == result
+
+        # fixtures of other mtypes, to also cover failing checks
+        for other_mtype in _get_all_mtypes_for_scitype(scitype):
+            other_fixture = get_examples(mtype=other_mtype, as_scitype=scitype).get(
+                fixture_index
+            )
+            if other_mtype == mtype or other_fixture is None:
+                continue
+            fast_result = check_is_mtype_fast(other_fixture, mtype, scitype, True)
+            result = check_is_mtype(other_fixture, mtype, scitype, True)
+            assert fast_result == result
+
+
+def test_check_is_mtype_many(scitype, mtype):
+    """Tests that check_is_mtype_many agrees with check_is_mtype on examples.
+
+    Parameters
+    ----------
+    scitype : str - name of scitype for which mtype conversions are tested
+
+    Raises
+    ------
+    AssertionError if check_is_mtype_many and check_is_mtype returns differ
+    error if check itself raises an error
+    """
+    # todo: possibly remove this once all checks are defined
+    if (mtype, scitype) not in check_dict.keys():
+        return None
+
+    # fixtures of all mtypes of the scitype, to have positive and negative cases
+    fixtures = []
+    for other_mtype in _get_all_mtypes_for_scitype(scitype):
+        examples = get_examples(mtype=other_mtype, as_scitype=scitype)
+        fixtures += [x for x in examples.values() if x is not None]
+
+    results = check_is_mtype_many(fixtures, mtype, scitype)
+    expected = [check_is_mtype(x, mtype, scitype) for x in fixtures]
+    assert results == expected
+
+
+def _get_counting_cached_check(monkeypatch):
+    """Return check_is_mtype wrapped in the identity cache, and its call list."""
+    monkeypatch.setenv("SKTIME_CHECK_CACHE", "1")
+    calls = []
+
+    def check_fun(obj, mtype, scitype=None, return_metadata=False, var_name="obj"):
+        calls.append(mtype)
+        return check_is_mtype(obj, mtype, scitype, return_metadata, var_name)
+
+    return _cache_by_identity(check_fun), calls
+
+
+def test_check_cache_hit(monkeypatch):
+    """Tests that a repeated check of the same object is served from the cache."""
+    cached_check, calls = _get_counting_cached_check(monkeypatch)
+    X = np.zeros((5, 2))
+
+    assert cached_check(X, "np.ndarray", "Series")
+    assert cached_check(X, "np.ndarray", "Series")
+    assert len(calls) == 1
+
+
+def test_check_cache_eviction(monkeypatch):
+    """Tests that cache entries are removed when the object is collected."""
+    cached_check, calls = _get_counting_cached_check(monkeypatch)
+    X = np.zeros((5, 2))
+
+    cached_check(X, "np.ndarray", "Series")
+    assert len(cached_check._cache) == 1
+
+    del X
+    gc.collect()
+    assert len(cached_check._cache) == 0
+
+
+def test_check_cache_reshape(monkeypatch):
+    """Tests that an array reshaped in place is checked again."""
+    cached_check, calls = _get_counting_cached_check(monkeypatch)
+    X = np.zeros((5, 2))
+
+    cached_check(X, "np.ndarray", "Series")
+    X.shape = (10,)
+    cached_check(X, "np.ndarray", "Series")
+    assert len(calls) == 2
+
+
+def test_check_cache_metadata_copy(monkeypatch):
+    """Tests that changing returned metadata does not change later cache hits."""
+    cached_check, calls = _get_counting_cached_check(monkeypatch)
+    X = np.zeros((5, 2))
+
+    metadata = cached_check(X, "np.ndarray", "Series", return_metadata=True)[2]
+    expected = dict(metadata)
+    metadata["mtype"] = "pd.DataFrame"
+    metadata["is_univariate"] = True
+
+    assert cached_check(X, "np.ndarray", "Series", return_metadata=True)[2] == expected
+    assert len(calls) == 1
+
+
+def test_check_cache_invalid_scitype(monkeypatch):
+    """Tests that an unhashable scitype raises the usual error with the cache."""
+    cached_check, calls = _get_counting_cached_check(monkeypatch)
+
+    with pytest.raises(TypeError, match="scitype should be a str"):
+        cached_check(np.zeros((5, 2)), "np.ndarray", ["Series"])
+
+
+def test_check_is_deprecation(monkeypatch):
+    """Tests that the first call of check_is warns that it is deprecated."""
+    monkeypatch.setattr("sktime.datatypes._check._check_is_warned", False)
+
+    with pytest.warns(FutureWarning, match="check_is is deprecated"):
+        assert check_is(np.zeros((5, 2)), "np.ndarray", "Series")
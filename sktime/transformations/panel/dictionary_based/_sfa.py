@@ -292,6 +292,85 @@ class SFA(_PanelToPanelTransformer):
 
         return bags
 
+    def _transform_words(self, X):
+        """Transform data into the SFA word of every window, without counting bags.
+
+        Parameters
+        ----------
+        X : pandas DataFrame or 3d numpy array, input time series.
+
+        Returns
+        -------
+        2d numpy array of shape = [n_instances, n_windows] containing SFA words,
+            int64 for words of up to 64 bits, otherwise object holding Python ints
+        """
+        self.check_is_fitted()
+        X = check_X(X, enforce_univariate=True, coerce_to_numpy=True)
+        X = X.squeeze(1)
+
+        if self.word_bits > 64:
+            # words too large for an int64 are built one window at a time
+            words = np.empty(
+                (X.shape[0], max(1, X.shape[1] - self.window_size + 1)), dtype=object
+            )
+            for i in range(X.shape[0]):
+                for window, dft in enumerate(self._mft(X[i])):
+                    words[i, window] = self._create_word_large(dft)
+            return words
+
+        start_offset = 2 if self.norm else 0
+        length = self.dft_length + start_offset + self.dft_length % 2
+        end = max(1, X.shape[1] - self.window_size + 1)
+
+        # the first window of each series is transformed here, the rest are
+        # found with the momentary fourier transform in the fused kernel
+        if self.use_fallback_dft:
+            first_dfts = np.array(
+                [
+                    self._discrete_fourier_transform(
+                        X[i, : self.window_size],
+                        self.dft_length,
+                        self.norm,
+                        self.inverse_sqrt_win_size,
+                        self.lower_bounding,
+                        apply_normalising_factor=False,
+                        cut_start_if_norm=False,
+                    )
+                    for i in range(X.shape[0])
+                ]
+            )
+        else:
+            X_fft = np.fft.rfft(X[:, : self.window_size], axis=-1)
+            first_dfts = np.empty((X.shape[0], length), dtype=np.float64)
+            first_dfts[:, 0::2] = np.real(X_fft)[:, : np.uint32(length / 2)]
+            first_dfts[:, 1::2] = np.imag(X_fft)[:, : np.uint32(length / 2)]
+
+        phis = SFA._get_phis(self.window_size, length)
+        stds = np.array(
+            [
+                SFA._calc_incremental_mean_std(X[i, :], end, self.window_size)
+                for i in range(X.shape[0])
+            ]
+        ).reshape(X.shape[0], end)
+        coefficients = start_offset + (
+            self.support if self.anova else np.arange(self.word_length)
+        )
+
+        return SFA._mft_words(
+            X,
+            first_dfts,
+            phis,
+            stds,
+            self.window_size,
+            self.inverse_sqrt_win_size,
+            self.lower_bounding,
+            coefficients.astype(np.int64),
+            self.breakpoints,
+            self.word_length,
+            self.alphabet_size,
+            self.letter_bits,
+        )
+
     def _transform_case(self, X, supplied_dft=None):
         if supplied_dft is None:
             dfts = self._mft(X)
@@ -389,12 +468,7 @@ class SFA(_PanelToPanelTransformer):
 
     def _binning(self, X, y=None):
         num_windows_per_inst = math.ceil(self.series_length / self.window_size)
-        dft = np.array(
-            [
-                self._binning_dft(X[i, :], num_windows_per_inst)
-                for i in range(self.n_instances)
-            ]
-        )
+        dft = self._binning_dft(X, num_windows_per_inst)
         if self.keep_binning_dft:
             self.binning_dft = dft
         dft = dft.reshape(len(X) * num_windows_per_inst, self.dft_length)
@@ -447,10 +521,14 @@ class SFA(_PanelToPanelTransformer):
         total_num_windows = int(self.n_instances * num_windows_per_inst)
         breakpoints = np.zeros((self.word_length, self.alphabet_size))
 
-        for letter in range(self.word_length):
-            res = [round(dft[i][letter] * 100) / 100 for i in range(total_num_windows)]
-            column = np.sort(np.array(res))
+        # round to two decimals and sort the values of all letters at once,
+        # np.round rounds half to even the same as the builtin round
+        columns = np.sort(
+            np.round(dft[:total_num_windows, : self.word_length] * 100) / 100, axis=0
+        )
 
+        for letter in range(self.word_length):
+            column = columns[:, letter]
             bin_index = 0
 
             # use equi-depth binning
@@ -490,35 +568,32 @@ class SFA(_PanelToPanelTransformer):
 
         return np.sort(breakpoints, axis=1)
 
-    def _binning_dft(self, series, num_windows_per_inst):
-        # Splits individual time series into windows and returns the DFT for
-        # each
-        split = np.split(
-            series,
-            np.linspace(
-                self.window_size,
-                self.window_size * (num_windows_per_inst - 1),
-                num_windows_per_inst - 1,
-                dtype=np.int_,
-            ),
+    def _binning_dft(self, X, num_windows_per_inst):
+        # Splits each time series into non-overlapping windows, the last one
+        # aligned to the end of the series, and returns the DFT for each
+        starts = np.append(
+            np.arange(num_windows_per_inst - 1) * self.window_size,
+            self.series_length - self.window_size,
+        )
+        # the gathered windows are made contiguous, so the std and fft of each
+        # window sum in the same order as for a single window
+        windows = np.ascontiguousarray(
+            X[:, starts[:, None] + np.arange(self.window_size)]
         )
-        start = self.series_length - self.window_size
-        split[-1] = series[start : self.series_length]
 
-        result = np.zeros((len(split), self.dft_length), dtype=np.float64)
+        if not self.use_fallback_dft:
+            return self._fast_fourier_transform(windows)
 
-        for i, row in enumerate(split):
-            result[i] = (
-                self._discrete_fourier_transform(
-                    row,
+        result = np.zeros((*windows.shape[:2], self.dft_length), dtype=np.float64)
+        for i in range(windows.shape[0]):
+            for j in range(windows.shape[1]):
+                result[i, j] = self._discrete_fourier_transform(
+                    windows[i, j],
                     self.dft_length,
                     self.norm,
                     self.inverse_sqrt_win_size,
                     self.lower_bounding,
                 )
-                if self.use_fallback_dft
-                else self._fast_fourier_transform(row)
-            )
 
         return result
 
@@ -530,32 +605,32 @@ class SFA(_PanelToPanelTransformer):
         Input
         -------
         X : The training input samples.  array-like or sparse matrix of
-        shape = [n_samps, num_atts]
+        shape = [..., num_atts], transformed along the last axis
 
         Returns
         -------
-        1D array of fourier term, real_0,imag_0, real_1, imag_1 etc, length
-        num_atts or
+        array of fourier terms along the last axis, real_0,imag_0, real_1,
+        imag_1 etc, length num_atts or
         num_atts-2 if if self.norm is True
         """
         # first two are real and imaginary parts
         start = 2 if self.norm else 0
 
-        s = np.std(series)
-        std = s if s > 1e-8 else 1
+        s = np.std(series, axis=-1, keepdims=True)
+        std = np.where(s > 1e-8, s, 1)
 
-        X_fft = np.fft.rfft(series)
+        X_fft = np.fft.rfft(series, axis=-1)
         reals = np.real(X_fft)
         imags = np.imag(X_fft)
 
         length = start + self.dft_length
-        dft = np.empty((length,), dtype=reals.dtype)
-        dft[0::2] = reals[: np.uint32(length / 2)]
-        dft[1::2] = imags[: np.uint32(length / 2)]
+        dft = np.empty((*series.shape[:-1], length), dtype=reals.dtype)
+        dft[..., 0::2] = reals[..., : np.uint32(length / 2)]
+        dft[..., 1::2] = imags[..., : np.uint32(length / 2)]
         if self.lower_bounding:
-            dft[1::2] = dft[1::2] * -1  # lower bounding
+            dft[..., 1::2] *= -1  # lower bounding
         dft *= self.inverse_sqrt_win_size / std
-        return dft[start:]
+        return dft[..., start:]
 
     @staticmethod
     @njit(fastmath=True, cache=True)
@@ -886,6 +961,59 @@ class SFA(_PanelToPanelTransformer):
 
         return word
 
+    @staticmethod
+    @njit(fastmath=True, cache=True)
+    def _mft_words(
+        X,
+        first_dfts,
+        phis,
+        stds,
+        window_size,
+        inverse_sqrt_win_size,
+        lower_bounding,
+        coefficients,
+        breakpoints,
+        word_length,
+        alphabet_size,
+        letter_bits,
+    ):
+        # fuses _mft and _create_word, so the fourier coefficients of each window
+        # are turned into a word as soon as they are found rather than stored
+        words = np.zeros(stds.shape, dtype=np.int64)
+        for n in range(X.shape[0]):
+            mft_data = first_dfts[n].copy()
+
+            for window in range(stds.shape[1]):
+                if window > 0:
+                    for c in range(0, len(mft_data), 2):
+                        real = (
+                            mft_data[c]
+                            + X[n, window + window_size - 1]
+                            - X[n, window - 1]
+                        )
+                        imag = mft_data[c + 1]
+                        mft_data[c] = real * phis[c] - imag * phis[c + 1]
+                        mft_data[c + 1] = real * phis[c + 1] + phis[c] * imag
+                normalising_factor = inverse_sqrt_win_size / stds[n, window]
+
+                word = np.int64(0)
+                for i in range(word_length):
+                    c = coefficients[i]
+                    if window == 0:
+                        value = mft_data[c] * inverse_sqrt_win_size / stds[n, 0]
+                    else:
+                        value = mft_data[c] * normalising_factor
+                    if lower_bounding and c % 2 == 1:
+                        value = value * -1
+
+                    for bp in range(alphabet_size):
+                        if value <= breakpoints[i][bp]:
+                            word = (word << letter_bits) | bp
+                            break
+                words[n, window] = word
+
+        return words
+
     def _create_word_large(self, dft):
         word = 0
         for i in range(self.word_length):
@@ -4,7 +4,7 @@ import sys
 import numpy as np
 import pytest
 
-from sktime.datasets import load_gunpoint
+from sktime.datasets import load_gunpoint, load_unit_test
 from sktime.transformations.panel.dictionary_based._sfa import SFA
 from sktime.datatypes._panel._convert import from_nested_to_2d_array
 
@@ -33,6 +33,52 @@ def test_transformer(binning_method):
     _ = p.transform(X, y)
 
 
+# Check the breakpoints of data dependent binning are unchanged.
+@pytest.mark.parametrize("binning_method", ["kmeans", "information-gain"])
+def test_breakpoints(binning_method):
+    # load training data
+    X, y = load_unit_test(split="train", return_X_y=True)
+
+    p = SFA(
+        word_length=6,
+        alphabet_size=4,
+        window_size=12,
+        binning_method=binning_method,
+    )
+    p.fit(X, y)
+
+    np.testing.assert_array_almost_equal(
+        p.breakpoints, sfa_unit_test_breakpoints[binning_method], decimal=6
+    )
+
+
+# Check the batched binning DFT equals the DFT of each window on its own.
+@pytest.mark.parametrize("norm", [True, False])
+@pytest.mark.parametrize("window_size", [10, 12])
+def test_binning_dft(norm, window_size):
+    # load training data
+    X, y = load_unit_test(split="train", return_X_y=True)
+    X_tab = from_nested_to_2d_array(X, return_numpy=True)
+
+    p = SFA(
+        word_length=6,
+        alphabet_size=4,
+        window_size=window_size,
+        norm=norm,
+        keep_binning_dft=True,
+    ).fit(X, y)
+
+    series_length = X_tab.shape[1]
+    num_windows = int(np.ceil(series_length / window_size))
+    starts = [i * window_size for i in range(num_windows - 1)]
+    starts.append(series_length - window_size)
+
+    for i in range(X_tab.shape[0]):
+        for j, start in enumerate(starts):
+            dft = p._fast_fourier_transform(X_tab[i, start : start + window_size])
+            np.testing.assert_array_equal(p.binning_dft[i, j], dft)
+
+
 @pytest.mark.parametrize("use_fallback_dft", [True, False])
 @pytest.mark.parametrize("norm", [True, False])
 def test_dft_mft(use_fallback_dft, norm):
@@ -202,3 +248,32 @@ def test_typed_dict():
     word_list2 = p2.bag_to_string(p2.transform(X, y)[0][0])
 
     assert word_list == word_list2
+
+
+sfa_unit_test_breakpoints = {
+    "kmeans": np.array(
+        [
+            [24.70100679, 46.82159961, 70.58487625, sys.float_info.max],
+            [0.00000000, 0.00000000, 0.00000000, sys.float_info.max],
+            [-3.32414853, 1.00508265, 5.66921763, sys.float_info.max],
+            [-3.54755745, 0.53542278, 4.13149708, sys.float_info.max],
+            [0.42313593, 1.77750840, 3.05572136, sys.float_info.max],
+            [-2.82844276, -1.85384297, 1.78497301, sys.float_info.max],
+        ]
+    ),
+    "information-gain": np.array(
+        [
+            [10.95499229, 49.04647636, sys.float_info.max, sys.float_info.max],
+            [
+                sys.float_info.max,
+                sys.float_info.max,
+                sys.float_info.max,
+                sys.float_info.max,
+            ],
+            [1.26480621, 5.98518705, sys.float_info.max, sys.float_info.max],
+            [-3.12172449, -1.93519056, sys.float_info.max, sys.float_info.max],
+            [1.06879604, 2.83402741, sys.float_info.max, sys.float_info.max],
+            [-3.17041802, -2.50725925, 3.89788353, sys.float_info.max],
+        ]
+    ),
+}